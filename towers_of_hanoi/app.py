@@ -1,11 +1,25 @@
 from flask import Flask, render_template, request, jsonify
 from core.game_logic import HanoiGame
 from core.ai_solver import HanoiSolver
+from config import config
+from core.history_store import GameHistoryStore
+from core.model_manager import ModelManager
+import atexit
 import json
+import os
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'your_secret_key'
 
+history_store = GameHistoryStore()
+atexit.register(history_store.close)
+
+model_manager = ModelManager()
+# app.run(debug=True) re-runs this script in a reloader child; the parent
+# never serves requests, so only the serving process loads models
+if __name__ != '__main__' or os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+    model_manager.start()
+
 @app.route('/')
 def index():
     return render_template('game.html')
@@ -14,7 +28,7 @@ def index():
 def new_game():
     num_disks = int(request.json.get('disks', 3))
     game = HanoiGame(num_disks)
-    solver = HanoiSolver(num_disks)
+    solver = HanoiSolver(num_disks, model_manager.get(num_disks))
     return jsonify({
         'poles': game.poles,
         'num_disks': num_disks
@@ -30,19 +44,31 @@ def make_move():
     game.poles = data['poles']
     
     if game.move_disk(from_pole, to_pole):
+        is_solved = game.is_solved()
+        if is_solved and not data.get('assisted'):
+            record_solved_game(game, data.get('history'), (from_pole, to_pole))
         return jsonify({
             'success': True,
             'poles': game.poles,
-            'is_solved': game.is_solved()
+            'is_solved': is_solved
         })
     return jsonify({'success': False})
 
+def record_solved_game(game, history, last_move):
+    """Record a game whose history first reaches the solved position on last_move"""
+    if not isinstance(history, list) or len(history) >= config.HISTORY_MAX_MOVES:
+        return
+    replay = HanoiGame(game.num_disks)
+    moves = history + [list(last_move)]
+    if replay.replay(moves, stop_at_solve=True) and replay.poles == game.poles:
+        history_store.record_game(replay.num_disks, replay.move_log)
+
 @app.route('/solve', methods=['POST'])
 def solve():
     data = request.json
     game = HanoiGame(data['num_disks'])
     game.poles = data['poles']
-    solver = HanoiSolver(data['num_disks'])
+    solver = HanoiSolver(data['num_disks'], model_manager.get(data['num_disks']))
     solution = solver.solve_iterative(game)
     return jsonify({'solution': solution})
 
@@ -51,7 +77,7 @@ def hint():
     data = request.json
     game = HanoiGame(data['num_disks'])
     game.poles = data['poles']
-    solver = HanoiSolver(data['num_disks'])
+    solver = HanoiSolver(data['num_disks'], model_manager.get(data['num_disks']))
     move = solver.suggest_move(game.poles)
     
     if move:
@@ -60,5 +86,33 @@ def hint():
     
     return jsonify({'move': move})
 
+@app.route('/history/best', methods=['GET'])
+def best_scores():
+    return jsonify({'best': history_store.best_move_counts()})
+
+@app.route('/history/recent', methods=['GET'])
+def recent_games():
+    limit = request.args.get('limit', 10, type=int)
+    limit = max(1, min(limit, config.HISTORY_MAX_RECENT))
+    num_disks = request.args.get('disks', type=int)
+    return jsonify({'games': history_store.recent_games(limit, num_disks)})
+
+@app.route('/models/status', methods=['GET'])
+def model_status():
+    return jsonify({'models': model_manager.status()})
+
+@app.route('/models/rollback', methods=['POST'])
+def model_rollback():
+    data = request.get_json(silent=True) or {}
+    try:
+        disks = int(data['disks'])
+    except (KeyError, TypeError, ValueError):
+        return jsonify({'success': False, 'error': 'disks must be an integer'}), 400
+    try:
+        versions = model_manager.rollback(disks, data.get('model_type'))
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    return jsonify({'success': True, 'versions': versions})
+
 if __name__ == '__main__':
     app.run(debug=True)
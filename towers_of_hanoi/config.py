@@ -58,6 +58,17 @@ class Config:
     AI_BATCH_SIZE: int = 32
     AI_LEARNING_RATE: float = 0.001
     AI_DROPOUT_RATE: float = 0.2
+    MODEL_VERSIONS_DIR: str = "versions"
+    MODEL_MANIFEST_FILE: str = "manifest.json"
+    MODEL_POLL_INTERVAL: float = 5.0  # seconds between manifest checks
+    
+    # Game history settings
+    HISTORY_DB_FILE: str = "game_history.db"
+    HISTORY_QUEUE_SIZE: int = 1000  # Pending games before new records are dropped
+    HISTORY_BATCH_SIZE: int = 50  # Games written per transaction
+    HISTORY_FLUSH_INTERVAL: float = 1.0  # seconds a partial batch may wait
+    HISTORY_MAX_MOVES: int = 4096  # Longer submitted games are not recorded
+    HISTORY_MAX_RECENT: int = 100  # Upper bound for recent games queries
     
     # Sound settings
     SOUND_ENABLED: bool = True
@@ -107,6 +118,23 @@ class Config:
         
         return model_dir / filename
     
+    @staticmethod
+    def get_model_versions_dir() -> Path:
+        """Get the directory holding versioned model files"""
+        versions_dir = Config.get_model_dir() / Config.MODEL_VERSIONS_DIR
+        versions_dir.mkdir(parents=True, exist_ok=True)
+        return versions_dir
+    
+    @staticmethod
+    def get_model_manifest_path() -> Path:
+        """Get path to the model version manifest"""
+        return Config.get_model_dir() / Config.MODEL_MANIFEST_FILE
+    
+    @staticmethod
+    def get_history_db_path() -> Path:
+        """Get path to the SQLite game history database"""
+        return Config.get_data_dir() / Config.HISTORY_DB_FILE
+    
     @staticmethod
     def get_sound_path(sound_type: str) -> Path:
         """Get path to sound file"""
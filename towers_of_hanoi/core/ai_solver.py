@@ -4,11 +4,16 @@ from .models.state_classifier import StateClassifier
 from config import config
 
 class HanoiSolver:
-    def __init__(self, num_disks=3):
+    def __init__(self, num_disks=3, models=None):
         self.num_disks = num_disks
-        self.move_predictor = MovePredictor(num_disks)
-        self.state_classifier = StateClassifier(num_disks)
-        self.models_loaded = self.load_models()
+        if models is not None:
+            # Already loaded and warmed by the ModelManager
+            self.move_predictor, self.state_classifier = models
+            self.models_loaded = True
+        else:
+            self.move_predictor = MovePredictor(num_disks)
+            self.state_classifier = StateClassifier(num_disks)
+            self.models_loaded = self.load_models()
         
     def load_models(self):
         """Attempt to load pre-trained models"""
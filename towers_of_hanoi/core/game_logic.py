@@ -13,6 +13,7 @@ class HanoiGame:
         self.poles = [[i for i in range(self.num_disks, 0, -1)], [], []]
         self.moves = 0
         self.history = deque(maxlen=100)
+        self.move_log = []  # Full move sequence, kept for the history store
 
     def is_valid_move(self, from_pole, to_pole):
         """Check if a move is valid"""
@@ -33,13 +34,33 @@ class HanoiGame:
             self.poles[to_pole].append(disk)
             self.moves += 1
             self.history.append((from_pole, to_pole))
+            self.move_log.append((from_pole, to_pole))
             return True
         return False
     
+    def replay(self, moves, stop_at_solve=False):
+        """Reset and apply moves in order; False if any is malformed or invalid.
+
+        With stop_at_solve, moves made after the puzzle is first solved
+        also make the replay fail, so a solved game counts only once.
+        """
+        self.reset()
+        for move in moves:
+            if stop_at_solve and self.is_solved():
+                return False
+            if not isinstance(move, (list, tuple)) or len(move) != 2:
+                return False
+            if not all(type(pole) is int for pole in move):
+                return False
+            if not self.move_disk(*move):
+                return False
+        return True
+    
     def undo_move(self):
         """Undo the last move"""
         if self.history:
             to_pole, from_pole = self.history.pop()  # Reverse the move
+            self.move_log.pop()
             disk = self.poles[from_pole].pop()
             self.poles[to_pole].append(disk)
             self.moves -= 1
@@ -0,0 +1,155 @@
+import queue
+import sqlite3
+import threading
+import time
+from config import config
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    num_disks INTEGER NOT NULL,
+    move_count INTEGER NOT NULL,
+    moves BLOB NOT NULL,
+    finished_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_games_disks_moves ON games (num_disks, move_count);
+CREATE INDEX IF NOT EXISTS idx_games_finished_at ON games (finished_at);
+CREATE INDEX IF NOT EXISTS idx_games_disks_finished_at ON games (num_disks, finished_at);
+"""
+
+_STOP = object()
+
+
+def pack_moves(moves):
+    """Pack (from_pole, to_pole) pairs into bytes, two moves per byte"""
+    codes = []
+    for from_pole, to_pole in moves:
+        if from_pole not in range(3) or to_pole not in range(3):
+            raise ValueError(f"Invalid move: ({from_pole}, {to_pole})")
+        codes.append(from_pole * 3 + to_pole)
+    if len(codes) % 2:
+        codes.append(0)
+    return bytes((codes[i] << 4) | codes[i + 1] for i in range(0, len(codes), 2))
+
+
+def unpack_moves(packed, move_count):
+    """Inverse of pack_moves; move_count drops the padding nibble"""
+    moves = []
+    for byte in packed:
+        moves.append(divmod(byte >> 4, 3))
+        moves.append(divmod(byte & 0x0F, 3))
+    return moves[:move_count]
+
+
+class GameHistoryStore:
+    """SQLite store of completed games with a write-behind queue.
+
+    record_game only enqueues; a background thread writes batches in a
+    single transaction. The database runs in WAL mode so the read methods
+    never wait on the writer.
+    """
+
+    def __init__(self, db_path=None):
+        self.db_path = str(db_path or config.get_history_db_path())
+        self._queue = queue.Queue(maxsize=config.HISTORY_QUEUE_SIZE)
+        self._local = threading.local()
+
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+        conn.close()
+
+        self._writer = threading.Thread(target=self._write_loop, daemon=True)
+        self._writer.start()
+
+    def record_game(self, num_disks, moves):
+        """Queue a completed game for writing; returns False if dropped"""
+        row = (num_disks, len(moves), pack_moves(moves), time.time())
+        try:
+            self._queue.put_nowait(row)
+            return True
+        except queue.Full:
+            print("Game history queue full, dropping game record")
+            return False
+
+    def flush(self):
+        """Block until every queued game has been written"""
+        self._queue.join()
+
+    def close(self):
+        """Write any pending games and stop the writer thread"""
+        if self._writer.is_alive():
+            self._queue.put(_STOP)
+            self._writer.join()
+
+    def _write_loop(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        running = True
+        while running:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + config.HISTORY_FLUSH_INTERVAL
+            while len(batch) < config.HISTORY_BATCH_SIZE and batch[-1] is not _STOP:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+
+            if batch[-1] is _STOP:
+                running = False
+            rows = [row for row in batch if row is not _STOP]
+            try:
+                with conn:
+                    conn.executemany(
+                        "INSERT INTO games (num_disks, move_count, moves, finished_at) "
+                        "VALUES (?, ?, ?, ?)",
+                        rows
+                    )
+            except sqlite3.Error as e:
+                print(f"Error writing game history: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+        conn.close()
+
+    def _reader(self):
+        """Per-thread read-only connection"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True)
+            self._local.conn = conn
+        return conn
+
+    def best_move_counts(self):
+        """Fewest moves recorded for each disk count"""
+        rows = self._reader().execute(
+            "SELECT num_disks, MIN(move_count) FROM games GROUP BY num_disks"
+        ).fetchall()
+        return {num_disks: move_count for num_disks, move_count in rows}
+
+    def recent_games(self, limit=10, num_disks=None):
+        """Most recently finished games, newest first"""
+        query = "SELECT id, num_disks, move_count, finished_at FROM games"
+        params = []
+        if num_disks is not None:
+            query += " WHERE num_disks = ?"
+            params.append(num_disks)
+        query += " ORDER BY finished_at DESC LIMIT ?"
+        params.append(limit)
+        rows = self._reader().execute(query, params).fetchall()
+        return [
+            {'id': game_id, 'num_disks': disks, 'moves': move_count, 'finished_at': finished_at}
+            for game_id, disks, move_count, finished_at in rows
+        ]
+
+    def get_moves(self, game_id):
+        """Full move sequence of a recorded game, or None if unknown"""
+        row = self._reader().execute(
+            "SELECT moves, move_count FROM games WHERE id = ?", (game_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        return unpack_moves(*row)
@@ -0,0 +1,131 @@
+import threading
+from collections import namedtuple
+from config import config
+from .model_store import model_store, MODEL_TYPES
+from .models.move_predictor import MovePredictor
+from .models.state_classifier import StateClassifier
+
+LoadedModels = namedtuple("LoadedModels", ["move_predictor", "state_classifier"])
+
+_UNSET = object()
+
+_MODEL_CLASSES = {
+    "move_predictor": MovePredictor,
+    "state_classifier": StateClassifier
+}
+
+
+class ModelManager:
+    """Keeps warmed models in memory and hot-swaps them on new versions.
+
+    A background thread watches the model store manifest. When the active
+    version of a model changes it is loaded and warmed off the request
+    path, then swapped in with a single reference assignment. A model that
+    fails to load or verify leaves the previous one serving and is not
+    retried until the manifest changes again.
+    """
+
+    def __init__(self, store=None, poll_interval=None):
+        self.store = store or model_store
+        self.poll_interval = poll_interval or config.MODEL_POLL_INTERVAL
+        self._models = {}
+        self._errors = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._generation = _UNSET
+        self._watcher = None
+
+    def start(self):
+        """Load all available models and start watching for new versions"""
+        if self._watcher is None:
+            self._watcher = threading.Thread(target=self._watch_loop, daemon=True)
+            self._watcher.start()
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+        if self._watcher is not None:
+            self._watcher.join()
+            self._watcher = None
+
+    def get(self, disks):
+        """Currently serving models for a disk count, or None"""
+        return self._models.get(disks)
+
+    def _watch_loop(self):
+        while not self._stop.is_set():
+            woken = self._wake.is_set()
+            self._wake.clear()
+            if woken or self.store.manifest_generation() != self._generation:
+                self.refresh()
+            self._wake.wait(self.poll_interval)
+
+    def refresh(self):
+        """Load and swap in any model whose active version has changed"""
+        with self._lock:
+            manifest = self.store.load_manifest()
+            self._generation = manifest.get("generation")
+            for disks in range(config.MIN_DISKS, config.MAX_DISKS + 1):
+                current = self._models.get(disks)
+                updated = {}
+                for model_type in MODEL_TYPES:
+                    served = getattr(current, model_type, None)
+                    try:
+                        version = self.store.active_version(disks, model_type, manifest)
+                        if version is None or (served is not None and served.version == version):
+                            updated[model_type] = served
+                            continue
+                        updated[model_type] = self._load(disks, model_type, manifest)
+                        self._errors.pop((disks, model_type), None)
+                    except Exception as e:
+                        print(f"Error loading {model_type} for {disks} disks: {e}")
+                        self._errors[(disks, model_type)] = str(e)
+                        updated[model_type] = served
+
+                if None in updated.values():
+                    continue
+                candidate = LoadedModels(**updated)
+                if candidate != current:
+                    self._models[disks] = candidate
+
+    def _load(self, disks, model_type, manifest):
+        model = _MODEL_CLASSES[model_type](disks)
+        version, path = self.store.resolve(disks, model_type, manifest)
+        if not model.load_model(path):
+            raise ValueError(f"Could not load {path}")
+        model.version = version
+        self._warm(model, disks, model_type)
+        return model
+
+    @staticmethod
+    def _warm(model, disks, model_type):
+        """Run one prediction so the first request doesn't pay for graph setup"""
+        initial_state = (tuple(range(disks, 0, -1)), (), ())
+        if model_type == "move_predictor":
+            model.predict_move(initial_state)
+        else:
+            model.is_solved(initial_state)
+
+    def rollback(self, disks, model_type=None):
+        """Roll back one or both model types; the watcher swaps them in"""
+        model_types = [model_type] if model_type else MODEL_TYPES
+        versions = self.store.rollback(disks, model_types)
+        self._wake.set()
+        return versions
+
+    def status(self):
+        """Active and serving version per disk count and model type"""
+        manifest = self.store.load_manifest()
+        report = {}
+        for disks in range(config.MIN_DISKS, config.MAX_DISKS + 1):
+            loaded = self._models.get(disks)
+            report[disks] = {}
+            for model_type in MODEL_TYPES:
+                served = getattr(loaded, model_type, None)
+                report[disks][model_type] = {
+                    "active": self.store.active_version(disks, model_type, manifest),
+                    "serving": served.version if served is not None else None,
+                    "error": self._errors.get((disks, model_type))
+                }
+        return report
@@ -0,0 +1,188 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from config import config
+
+try:
+    import fcntl
+except ImportError:  # Windows: only in-process locking
+    fcntl = None
+
+MODEL_TYPES = ("move_predictor", "state_classifier")
+
+
+def file_checksum(path):
+    """SHA-256 of a file, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _atomic_write_json(path, data):
+    with tempfile.NamedTemporaryFile('w', dir=path.parent, suffix=".tmp", delete=False) as f:
+        json.dump(data, f, indent=4)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(f.name, path)
+
+
+class ModelStore:
+    """Versioned model files described by a JSON manifest.
+
+    Each published model is moved into the versions directory under a new
+    version number together with its checksum. The manifest records the
+    active version per model and is only ever replaced atomically, so a
+    reader sees either the old or the new state, never a partial one.
+    Updates hold a file lock so trainers and servers in other processes
+    don't lose each other's changes.
+    Models without a manifest entry resolve to the legacy fixed path.
+    """
+
+    def __init__(self, model_dir=None):
+        self._model_dir = Path(model_dir) if model_dir else None
+        self._lock = threading.Lock()
+
+    @property
+    def model_dir(self):
+        return self._model_dir or config.get_model_dir()
+
+    @property
+    def manifest_path(self):
+        if self._model_dir:
+            return self._model_dir / config.MODEL_MANIFEST_FILE
+        return config.get_model_manifest_path()
+
+    def _versions_dir(self):
+        if self._model_dir:
+            versions_dir = self._model_dir / config.MODEL_VERSIONS_DIR
+            versions_dir.mkdir(parents=True, exist_ok=True)
+            return versions_dir
+        return config.get_model_versions_dir()
+
+    @staticmethod
+    def model_key(disks, model_type):
+        """Manifest key, e.g. 'move_predictor_3d'"""
+        return Path(config.get_model_path(disks, model_type).name).stem
+
+    def _legacy_path(self, disks, model_type):
+        """Unversioned model file from before the manifest existed"""
+        return self.model_dir / config.get_model_path(disks, model_type).name
+
+    def manifest_generation(self):
+        """Update counter of the manifest, or None if it doesn't exist"""
+        return self.load_manifest().get("generation")
+
+    @contextmanager
+    def _update_manifest(self):
+        """Read-modify-write the manifest under thread and file locks"""
+        with self._lock, open(self.manifest_path.with_name("manifest.lock"), 'a') as lock_file:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                manifest = self.load_manifest()
+                yield manifest
+                # File mtimes are too coarse to tell quick successive writes apart
+                manifest["generation"] = manifest.get("generation", 0) + 1
+                _atomic_write_json(self.manifest_path, manifest)
+            finally:
+                if fcntl:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def load_manifest(self):
+        try:
+            with open(self.manifest_path, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def temp_path(self, disks, model_type):
+        """Scratch path in the versions directory for writing a new model"""
+        key = self.model_key(disks, model_type)
+        return self._versions_dir() / f".{key}.{os.getpid()}.{threading.get_ident()}.tmp.h5"
+
+    def publish(self, disks, model_type, source_path, activate=True):
+        """Move a fully written model file into the store as a new version"""
+        key = self.model_key(disks, model_type)
+        checksum = file_checksum(source_path)
+        with self._update_manifest() as manifest:
+            entry = manifest.setdefault(key, {"active": None, "history": [], "versions": {}})
+            version = max((int(v) for v in entry["versions"]), default=0) + 1
+            filename = f"{key}_v{version}.h5"
+            os.replace(source_path, self._versions_dir() / filename)
+            entry["versions"][str(version)] = {
+                "file": filename,
+                "sha256": checksum,
+                "created_at": time.time()
+            }
+            if activate:
+                self._set_active(entry, version)
+        return version
+
+    def activate(self, disks, model_type, version):
+        """Make an already published version the active one"""
+        key = self.model_key(disks, model_type)
+        with self._update_manifest() as manifest:
+            entry = manifest.get(key)
+            if entry is None or str(version) not in entry["versions"]:
+                raise ValueError(f"Unknown version {version} for {key}")
+            self._set_active(entry, int(version))
+
+    def rollback(self, disks, model_types=MODEL_TYPES):
+        """Reactivate the previous version of each model type together.
+
+        Nothing is changed unless every model type can be rolled back.
+        Returns the new active version per model type.
+        """
+        keys = {model_type: self.model_key(disks, model_type) for model_type in model_types}
+        with self._update_manifest() as manifest:
+            for key in keys.values():
+                entry = manifest.get(key)
+                if not entry or not entry["history"]:
+                    raise ValueError(f"No previous version to roll back to for {key}")
+            versions = {}
+            for model_type, key in keys.items():
+                entry = manifest[key]
+                entry["active"] = entry["history"].pop()
+                versions[model_type] = entry["active"]
+            return versions
+
+    @staticmethod
+    def _set_active(entry, version):
+        if entry["active"] is not None and entry["active"] != version:
+            entry["history"].append(entry["active"])
+        entry["active"] = version
+
+    def active_version(self, disks, model_type, manifest=None):
+        """Active version number, 0 for the legacy file, None if no model"""
+        manifest = self.load_manifest() if manifest is None else manifest
+        entry = manifest.get(self.model_key(disks, model_type))
+        if entry and entry["active"] is not None:
+            return entry["active"]
+        if self._legacy_path(disks, model_type).exists():
+            return 0
+        return None
+
+    def resolve(self, disks, model_type, manifest=None):
+        """Return (version, path) of the active model after verifying its checksum"""
+        manifest = self.load_manifest() if manifest is None else manifest
+        entry = manifest.get(self.model_key(disks, model_type))
+        if not entry or entry["active"] is None:
+            return 0, self._legacy_path(disks, model_type)
+
+        version = entry["active"]
+        info = entry["versions"][str(version)]
+        path = self._versions_dir() / info["file"]
+        if file_checksum(path) != info["sha256"]:
+            raise ValueError(f"Checksum mismatch for {path}")
+        return version, path
+
+
+# Shared store instance
+model_store = ModelStore()
@@ -5,10 +5,12 @@ from tensorflow.keras.layers import Dense, Flatten, Dropout
 from tensorflow.keras.optimizers import Adam
 from tensorflow.keras.callbacks import ModelCheckpoint
 from config import config
+from core.model_store import model_store
 
 class MovePredictor:
     def __init__(self, num_disks=3):
         self.num_disks = num_disks
+        self.version = None
         self.model = self._build_model()
 
     def _build_model(self):
@@ -28,20 +30,28 @@ class MovePredictor:
     
     def train(self, X_train, y_train, epochs=None, batch_size=None):
         """Train the move prediction model"""
+        # Checkpoint to a scratch file and publish once training is done,
+        # so a half-written model is never served
+        checkpoint_path = model_store.temp_path(self.num_disks, "move_predictor")
         checkpoint = ModelCheckpoint(
-            config.get_model_path(self.num_disks, "move_predictor"),
+            checkpoint_path,
             monitor='val_accuracy',
             save_best_only=True,
             mode='max'
         )
         
-        history = self.model.fit(
-            X_train, y_train,
-            validation_split=config.AI_VALIDATION_SPLIT,
-            epochs=epochs or config.AI_EPOCHS,
-            batch_size=batch_size or config.AI_BATCH_SIZE,
-            callbacks=[checkpoint]
-        )
+        try:
+            history = self.model.fit(
+                X_train, y_train,
+                validation_split=config.AI_VALIDATION_SPLIT,
+                epochs=epochs or config.AI_EPOCHS,
+                batch_size=batch_size or config.AI_BATCH_SIZE,
+                callbacks=[checkpoint]
+            )
+            if checkpoint_path.exists():
+                self.version = model_store.publish(self.num_disks, "move_predictor", checkpoint_path)
+        finally:
+            checkpoint_path.unlink(missing_ok=True)
         return history
     
     def predict_move(self, state):
@@ -62,12 +72,23 @@ class MovePredictor:
         return array
     
     def save_model(self, path=None):
-        path = path or config.get_model_path(self.num_disks, "move_predictor")
-        self.model.save(path)
+        """Save to path, or publish a new active version to the model store"""
+        if path:
+            self.model.save(path)
+            return None
+        tmp_path = model_store.temp_path(self.num_disks, "move_predictor")
+        try:
+            self.model.save(tmp_path, save_format='h5')
+            self.version = model_store.publish(self.num_disks, "move_predictor", tmp_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        return self.version
     
     def load_model(self, path=None):
-        path = path or config.get_model_path(self.num_disks, "move_predictor")
+        """Load from path, or the checksum-verified active version"""
         try:
+            if not path:
+                self.version, path = model_store.resolve(self.num_disks, "move_predictor")
             self.model = tf.keras.models.load_model(path)
             return True
         except Exception as e:
@@ -4,10 +4,12 @@ from tensorflow.keras.models import Sequential
 from tensorflow.keras.layers import Dense, Flatten, Dropout, Input
 from tensorflow.keras.optimizers import Adam
 from config import config
+from core.model_store import model_store
 
 class StateClassifier:
     def __init__(self, num_disks=3):
         self.num_disks = num_disks
+        self.version = None
         self.model = self._build_model()
         
     def _build_model(self):
@@ -52,12 +54,23 @@ class StateClassifier:
         return array
     
     def save_model(self, path=None):
-        path = path or config.get_model_path(self.num_disks, "state_classifier")
-        self.model.save(path)
+        """Save to path, or publish a new active version to the model store"""
+        if path:
+            self.model.save(path)
+            return None
+        tmp_path = model_store.temp_path(self.num_disks, "state_classifier")
+        try:
+            self.model.save(tmp_path, save_format='h5')
+            self.version = model_store.publish(self.num_disks, "state_classifier", tmp_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        return self.version
     
     def load_model(self, path=None):
-        path = path or config.get_model_path(self.num_disks, "state_classifier")
+        """Load from path, or the checksum-verified active version"""
         try:
+            if not path:
+                self.version, path = model_store.resolve(self.num_disks, "state_classifier")
             self.model = tf.keras.models.load_model(path)
             return True
         except Exception as e:
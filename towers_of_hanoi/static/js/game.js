@@ -2,7 +2,9 @@ let gameState = {
     poles: [[3, 2, 1], [], []],
     numDisks: 3,
     selectedPole: null,
-    moves: 0
+    moves: 0,
+    history: [],
+    assisted: false
 };
 
 let isSolving = false;
@@ -74,7 +76,9 @@ function moveDisk(fromPole, toPole) {
             from_pole: fromPole,
             to_pole: toPole,
             poles: gameState.poles,
-            num_disks: gameState.numDisks
+            num_disks: gameState.numDisks,
+            history: gameState.history,
+            assisted: gameState.assisted
         })
     })
     .then(response => response.json())
@@ -82,6 +86,7 @@ function moveDisk(fromPole, toPole) {
         if (data.success) {
             gameState.poles = data.poles;
             gameState.moves++;
+            gameState.history.push([fromPole, toPole]);
             renderBoard();
             updateStatus();
             
@@ -121,6 +126,8 @@ function newGame() {
         gameState.poles = data.poles;
         gameState.numDisks = data.num_disks;
         gameState.moves = 0;
+        gameState.history = [];
+        gameState.assisted = false;
         renderBoard();
         updateStatus();
     });
@@ -158,6 +165,7 @@ function solveGame() {
     }
     
     isSolving = true;
+    gameState.assisted = true;  // Auto-solved games are not recorded
     document.getElementById('solve').textContent = 'Stop';
     
     fetch('/solve', {
@@ -0,0 +1,26 @@
+from core.game_logic import HanoiGame
+
+SOLUTION_3 = [(0, 2), (0, 1), (2, 1), (0, 2), (1, 0), (1, 2), (0, 2)]
+
+
+def test_replay_solution():
+    game = HanoiGame(3)
+    assert game.replay(SOLUTION_3, stop_at_solve=True)
+    assert game.is_solved()
+    assert game.move_log == SOLUTION_3
+
+
+def test_replay_rejects_invalid_moves():
+    game = HanoiGame(3)
+    assert not game.replay([(5, 5)])
+    assert not game.replay([1])
+    assert not game.replay([(1.0, 2)])
+    assert not game.replay([(0, 2), (0, 2)])
+
+
+def test_replay_rejects_moves_after_solve():
+    game = HanoiGame(3)
+    moves = SOLUTION_3 + [(2, 1), (1, 2)]
+    assert game.replay(moves)
+    assert game.is_solved()
+    assert not game.replay(moves, stop_at_solve=True)